@@ -1,5 +1,6 @@
 """Filesystem utilities for project operations."""
 
+import os
 from pathlib import Path
 
 from rich.console import Console
@@ -42,14 +43,15 @@ def check_directory_empty(path: Path) -> bool:
     Returns:
         bool: True if directory is empty, False otherwise
     """
-    if not path.exists():
+    # scandir reads entries lazily, so this stops at the first one found
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is None
+    except FileNotFoundError:
         return True
-
-    if not path.is_dir():
+    except NotADirectoryError:
         return False
 
-    return not any(path.iterdir())
-
 
 def validate_target_directory(
     target_path: Path, allow_existing: bool = False
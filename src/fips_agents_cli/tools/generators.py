@@ -1,15 +1,19 @@
 """Generator utilities for rendering MCP component templates."""
 
 import ast
+import contextlib
+import functools
+import io
 import json
 import subprocess
 from pathlib import Path
 from typing import Any
 
 import jinja2
-import tomlkit
 from rich.console import Console
 
+from fips_agents_cli.tools.validation import get_cached_pyproject
+
 console = Console()
 
 
@@ -37,13 +41,16 @@ def get_project_info(project_root: Path) -> dict[str, Any]:
     """
     pyproject_path = project_root / "pyproject.toml"
 
-    if not pyproject_path.exists():
+    try:
+        # Usually already parsed by find_project_root() earlier in the command
+        pyproject = get_cached_pyproject(project_root)
+    except Exception as e:
+        raise ValueError(f"Failed to parse pyproject.toml: {e}") from e
+
+    if pyproject is None:
         raise FileNotFoundError(f"pyproject.toml not found at {pyproject_path}")
 
     try:
-        with open(pyproject_path) as f:
-            pyproject = tomlkit.parse(f.read())
-
         project_name = pyproject.get("project", {}).get("name", "unknown")
         project_version = pyproject.get("project", {}).get("version", "0.1.0")
         module_name = project_name.replace("-", "_")
@@ -86,23 +93,31 @@ def load_template(project_root: Path, component_type: str, template_name: str) -
         raise FileNotFoundError(f"Template not found: {template_path}")
 
     try:
-        with open(template_path) as f:
-            template_content = f.read()
-
-        # Create a Jinja2 environment with the template directory as the loader path
-        template_dir = template_path.parent
-        env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(template_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-
-        return env.from_string(template_content)
+        # The shared environment keeps compiled templates, so loading the same
+        # template again only costs an up-to-date check
+        env = _get_template_environment(str(template_path.parent))
+        return env.get_template(template_name)
 
     except jinja2.TemplateError as e:
         raise jinja2.TemplateError(f"Failed to load template {template_name}: {e}") from e
 
 
+@functools.lru_cache(maxsize=16)
+def _get_template_environment(template_dir: str) -> jinja2.Environment:
+    """
+    Return the Jinja2 environment for one generator template directory.
+
+    One environment per directory keeps include/import paths relative to the
+    component type's templates, as before. Jinja2 caches each compiled template
+    and, with auto_reload left on, recompiles it when the file changes.
+    """
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
 def validate_type_annotation(type_str: str) -> tuple[bool, str]:
     """
     Validate that a type annotation is properly formatted for FastMCP.
@@ -288,10 +303,14 @@ def render_component(template: jinja2.Template, variables: dict[str, Any]) -> st
         raise jinja2.TemplateError(f"Failed to render template: {e}") from e
 
 
+@functools.lru_cache(maxsize=128)
 def validate_python_syntax(code: str) -> tuple[bool, str]:
     """
     Validate Python code syntax using ast.parse().
 
+    Results are cached by source text, since regenerating a component
+    usually renders the same code again.
+
     Args:
         code: Python code as a string
 
@@ -341,13 +360,22 @@ def write_component_file(content: str, file_path: Path) -> None:
         raise OSError(f"Failed to write file {file_path}: {e}") from e
 
 
-def run_component_tests(project_root: Path, test_file: Path) -> tuple[bool, str]:
+def run_component_tests(
+    project_root: Path, test_file: Path, use_subprocess: bool = True
+) -> tuple[bool, str]:
     """
     Run pytest on a generated test file and capture output.
 
+    By default pytest runs in a subprocess from the project root, so the
+    project's own environment and a 30 second timeout apply. With
+    use_subprocess=False it runs in-process through pytest.main(), which
+    skips interpreter startup but shares this interpreter's modules and
+    cannot be timed out.
+
     Args:
         project_root: Path to the project root directory
         test_file: Path to the test file to run (relative or absolute)
+        use_subprocess: Run pytest in a subprocess (default) instead of in-process
 
     Returns:
         tuple: (success, output)
@@ -368,6 +396,9 @@ def run_component_tests(project_root: Path, test_file: Path) -> tuple[bool, str]
                 # test_file is not relative to project_root, use as-is
                 pass
 
+        if not use_subprocess:
+            return _run_pytest_in_process(project_root, test_file)
+
         # Run pytest with minimal output
         result = subprocess.run(
             ["pytest", str(test_file), "-v", "--tb=short"],
@@ -388,3 +419,22 @@ def run_component_tests(project_root: Path, test_file: Path) -> tuple[bool, str]
         return False, "pytest not found. Install with: pip install pytest"
     except Exception as e:
         return False, f"Failed to run tests: {e}"
+
+
+def _run_pytest_in_process(project_root: Path, test_file: Path) -> tuple[bool, str]:
+    """Run pytest via pytest.main() and capture what it prints."""
+    try:
+        import pytest
+    except ImportError:
+        return False, "pytest not found. Install with: pip install pytest"
+
+    if not test_file.is_absolute():
+        test_file = project_root / test_file
+
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        exit_code = pytest.main(
+            [str(test_file), "-v", "--tb=short", "--rootdir", str(project_root)]
+        )
+
+    return exit_code == pytest.ExitCode.OK, buffer.getvalue()
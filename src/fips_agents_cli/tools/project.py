@@ -5,14 +5,31 @@ import re
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 import tomlkit
 from rich.console import Console
 
+from fips_agents_cli.tools.validation import parse_toml
 from fips_agents_cli.version import __version__
 
 console = Console()
 
+# Project name assumed when a template's pyproject.toml has no [project] name
+_DEFAULT_OLD_NAME = "fastmcp-unified-template"
+
+# Template-specific files that shouldn't be in the new project
+_TEMPLATE_FILES_TO_REMOVE = (
+    ".github/workflows/template-cleanup.yml",  # Template-specific workflows
+)
+
+# Table and array-of-tables headers, and single-line `key = "string"` entries
+# in pyproject.toml
+_TOML_TABLE_RE = re.compile(r"^\s*\[(\[)?\s*([^\[\]]+?)\s*\]")
+_TOML_STRING_ENTRY_RE = re.compile(
+    r"""^(\s*)(["']?)([A-Za-z0-9_.-]+)\2(\s*=\s*)(["'])(.*?)\5(\s*(?:#.*)?)$"""
+)
+
 
 def validate_project_name(name: str) -> tuple[bool, str | None]:
     """
@@ -55,6 +72,8 @@ def to_module_name(project_name: str) -> str:
     Returns:
         str: A valid Python module name (hyphens replaced with underscores)
     """
+    if "-" not in project_name:
+        return project_name
     return project_name.replace("-", "_")
 
 
@@ -83,41 +102,41 @@ def update_project_name(project_path: Path, new_name: str) -> None:
         if not pyproject_path.exists():
             raise FileNotFoundError(f"pyproject.toml not found at {pyproject_path}")
 
-        # Read and parse pyproject.toml
-        with open(pyproject_path) as f:
-            pyproject = tomlkit.parse(f.read())
+        # Read and parse pyproject.toml (read-only parse; edits are made on the text)
+        text = pyproject_path.read_text()
+        pyproject = parse_toml(text)
 
         # Get the old project name from pyproject.toml
-        old_name = pyproject.get("project", {}).get("name", "fastmcp-unified-template")
+        old_name = pyproject.get("project", {}).get("name", _DEFAULT_OLD_NAME)
         old_module_name = to_module_name(old_name)
         new_module_name = to_module_name(new_name)
 
         # Update project name
         if "project" in pyproject:
-            pyproject["project"]["name"] = new_name
-
-            # Update entry point script name if it exists
-            if "scripts" in pyproject["project"]:
-                # Find and update any entry points that reference the old name
-                scripts = pyproject["project"]["scripts"]
-                old_scripts = dict(scripts)
-
-                for script_name, script_path in old_scripts.items():
-                    # Replace old module name with new module name in the path
-                    # (but only if it's actually in the path - new template uses src.main:main)
-                    new_script_path = script_path.replace(old_module_name, new_module_name)
-
-                    # Update the script name to match the new project name
-                    if script_name == old_name or script_name == old_module_name:
-                        del scripts[script_name]
-                        scripts[new_name] = new_script_path
-                    else:
-                        # Keep the same script name but update the path if needed
-                        scripts[script_name] = new_script_path
-
-        # Write updated pyproject.toml
-        with open(pyproject_path, "w") as f:
-            f.write(tomlkit.dumps(pyproject))
+            new_text = _rewrite_project_names(
+                text, old_name, new_name, old_module_name, new_module_name
+            )
+            expected = dict(
+                pyproject,
+                project=_renamed_project_table(
+                    pyproject["project"], old_name, new_name, old_module_name, new_module_name
+                ),
+            )
+            try:
+                rewrite_ok = parse_toml(new_text) == expected
+            except Exception:
+                # e.g. a renamed script entry now collides with an existing key
+                rewrite_ok = False
+            if not rewrite_ok:
+                # Layout the line rewrite doesn't cover (inline tables, dotted
+                # keys, multi-line strings), or it touched a line outside
+                # [project] - let tomlkit do the edit instead
+                new_text = _rewrite_project_names_tomlkit(
+                    text, old_name, new_name, old_module_name, new_module_name
+                )
+
+            # Write updated pyproject.toml
+            pyproject_path.write_text(new_text)
 
         console.print("[green]✓[/green] Updated pyproject.toml")
 
@@ -145,6 +164,121 @@ def update_project_name(project_path: Path, new_name: str) -> None:
         raise
 
 
+def _renamed_script(
+    script_name: str,
+    script_path: str,
+    old_name: str,
+    new_name: str,
+    old_module_name: str,
+    new_module_name: str,
+) -> tuple[str, str]:
+    """Return the (name, path) an entry point script should have after a rename."""
+    # Replace old module name with new module name in the path
+    # (but only if it's actually in the path - new template uses src.main:main)
+    new_script_path = script_path.replace(old_module_name, new_module_name)
+
+    # Update the script name to match the new project name
+    if script_name == old_name or script_name == old_module_name:
+        return new_name, new_script_path
+    # Keep the same script name but update the path if needed
+    return script_name, new_script_path
+
+
+def _renamed_project_table(
+    project: dict[str, Any],
+    old_name: str,
+    new_name: str,
+    old_module_name: str,
+    new_module_name: str,
+) -> dict[str, Any]:
+    """Return a copy of the [project] table as it should read after a rename."""
+    renamed = dict(project, name=new_name)
+    if "scripts" in project:
+        renamed["scripts"] = dict(
+            _renamed_script(name, path, old_name, new_name, old_module_name, new_module_name)
+            for name, path in project["scripts"].items()
+        )
+    return renamed
+
+
+def _rewrite_project_names(
+    text: str,
+    old_name: str,
+    new_name: str,
+    old_module_name: str,
+    new_module_name: str,
+) -> str:
+    """
+    Rename the project in pyproject.toml text without a round-trip TOML parse.
+
+    Only the `name` line of [project] and the entries of [project.scripts]
+    are touched, so comments and formatting elsewhere survive untouched.
+    """
+    lines = text.splitlines(keepends=True)
+    table = None
+
+    for i, line in enumerate(lines):
+        body = line.rstrip("\r\n")
+        eol = line[len(body) :]
+
+        header = _TOML_TABLE_RE.match(body)
+        if header:
+            # An [[array.of.tables]] header always leaves [project]/[project.scripts]
+            table = None if header.group(1) else header.group(2)
+            continue
+        if table not in ("project", "project.scripts"):
+            continue
+
+        entry = _TOML_STRING_ENTRY_RE.match(body)
+        if not entry:
+            continue
+        indent, key_quote, key, sep, quote, value, rest = entry.groups()
+
+        if table == "project":
+            if key == "name":
+                lines[i] = (
+                    f"{indent}{key_quote}name{key_quote}{sep}{quote}{new_name}{quote}{rest}{eol}"
+                )
+            continue
+
+        script_name, script_path = _renamed_script(
+            key, value, old_name, new_name, old_module_name, new_module_name
+        )
+        lines[i] = (
+            f"{indent}{key_quote}{script_name}{key_quote}{sep}"
+            f"{quote}{script_path}{quote}{rest}{eol}"
+        )
+
+    return "".join(lines)
+
+
+def _rewrite_project_names_tomlkit(
+    text: str,
+    old_name: str,
+    new_name: str,
+    old_module_name: str,
+    new_module_name: str,
+) -> str:
+    """Rename the project with a full tomlkit round trip (slow, but handles any layout)."""
+    pyproject = tomlkit.parse(text)
+    pyproject["project"]["name"] = new_name
+
+    if "scripts" in pyproject["project"]:
+        # Find and update any entry points that reference the old name
+        scripts = pyproject["project"]["scripts"]
+        old_scripts = dict(scripts)
+
+        for script_name, script_path in old_scripts.items():
+            new_script_name, new_script_path = _renamed_script(
+                script_name, script_path, old_name, new_name, old_module_name, new_module_name
+            )
+            if new_script_name != script_name:
+                del scripts[script_name]
+            scripts[new_script_name] = new_script_path
+
+    return tomlkit.dumps(pyproject)
+
+
 def _replace_in_file(path: Path, old: str, new: str) -> None:
     """Replace all occurrences of a string in a file, if the file exists."""
     if path.exists():
@@ -544,12 +678,7 @@ def cleanup_template_files(project_path: Path) -> None:
     Args:
         project_path: Path to the project root directory
     """
-    # Files to remove (commonly found in templates)
-    files_to_remove = [
-        ".github/workflows/template-cleanup.yml",  # Template-specific workflows
-    ]
-
-    for file_path in files_to_remove:
+    for file_path in _TEMPLATE_FILES_TO_REMOVE:
         full_path = project_path / file_path
         if full_path.exists():
             try:
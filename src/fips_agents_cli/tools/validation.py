@@ -1,15 +1,78 @@
 """Validation utilities for MCP component generation."""
 
+import functools
 import json
 import keyword
+import os
 import re
+import stat
+import string
+import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
-import tomlkit
-from rich.console import Console
-
-console = Console()
+# tomlkit, rich and subprocess are imported inside the functions that need
+# them: name, URI and HuggingFace validation never touch them, and this module
+# is imported by every generate/model-car invocation.
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # Python 3.10 has no stdlib TOML reader; fall back to tomlkit
+    tomllib = None
+
+# Parsed pyproject.toml files keyed on path, stored with the (mtime_ns, size) they
+# were parsed at so a newer version replaces the old entry; see get_cached_pyproject()
+_PYPROJECT_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+
+# Hard keywords only: soft keywords (match, case, type, _) are legal names
+_KEYWORDS = frozenset(keyword.kwlist)
+
+# Characters allowed in a snake_case component name
+_SNAKE_CASE_CHARS = frozenset(string.ascii_lowercase + string.digits + "_")
+_HF_URL_RE = re.compile(r"https?://(?:www\.)?huggingface\.co/([^/]+/[^/]+)(?:/.*)?$")
+
+# registry.com/org/repo:tag - the tag follows the last ':', the registry precedes
+# the first '/' and must contain a '.'
+_CONTAINER_URI_RE = re.compile(
+    r"(?P<registry>[^/]*\.[^/]*)/(?P<repo>.*):(?P<tag>[^:]+)\Z", re.DOTALL
+)
+
+# Error messages are fixed text, so build them once at import
+_COMPONENT_NAME_EMPTY_ERROR = "Component name cannot be empty"
+_COMPONENT_NAME_START_ERROR = "Component name must start with a letter or underscore"
+_COMPONENT_NAME_IDENTIFIER_ERROR = (
+    "Component name must be a valid Python identifier (use snake_case: "
+    "letters, numbers, underscores only)"
+)
+_COMPONENT_NAME_SNAKE_CASE_ERROR = (
+    "Component name should use snake_case (lowercase letters, numbers, underscores only)"
+)
+
+_CONTAINER_URI_HINT = (
+    "Expected format: registry.com/org/repo:tag\n"
+    "Example: quay.io/wjackson/models:granite-3.1-2b-instruct"
+)
+_MISSING_TAG_ERROR = f"Missing tag in container URI.\n{_CONTAINER_URI_HINT}"
+_EMPTY_TAG_ERROR = f"Empty tag in container URI.\n{_CONTAINER_URI_HINT}"
+_INVALID_URI_ERROR = f"Invalid container URI format.\n{_CONTAINER_URI_HINT}"
+_INVALID_REGISTRY_ERROR = (
+    f"Invalid registry format (should be a domain like quay.io).\n{_CONTAINER_URI_HINT}"
+)
+
+# Map component types to their directory locations under src/
+_COMPONENT_DIRS = {
+    "tool": "tools",
+    "resource": "resources",
+    "prompt": "prompts",
+    "middleware": "middleware",
+}
+
+
+def _warn(message: str) -> None:
+    """Print a warning, importing rich only when there is something to print."""
+    from rich.console import Console
+
+    Console().print(f"[yellow]⚠[/yellow] {message}")
 
 
 def find_project_root() -> Path | None:
@@ -29,30 +92,108 @@ def find_project_root() -> Path | None:
         >>> if root:
         ...     print(f"Found project at {root}")
     """
-    current_path = Path.cwd()
+    # Walk up the directory tree on plain strings; only the match becomes a Path
+    parent = os.getcwd()
+    while True:
+        pyproject_path = os.path.join(parent, "pyproject.toml")
 
-    # Walk up the directory tree
-    for parent in [current_path] + list(current_path.parents):
-        pyproject_path = parent / "pyproject.toml"
+        try:
+            st = os.stat(pyproject_path)
+        except OSError:
+            st = None
 
-        if pyproject_path.exists():
-            try:
-                with open(pyproject_path) as f:
-                    pyproject = tomlkit.parse(f.read())
+        # One stat per level; the parse itself is cached on (path, mtime, size)
+        if st is not None and stat.S_ISREG(st.st_mode):
+            if _is_mcp_pyproject(pyproject_path, st.st_mtime_ns, st.st_size):
+                return Path(parent)
 
-                # Check if this is an MCP server project
-                dependencies = pyproject.get("project", {}).get("dependencies", [])
+        grandparent = os.path.dirname(parent)
+        if grandparent == parent:
+            return None
+        parent = grandparent
 
-                # Check for fastmcp dependency
-                for dep in dependencies:
-                    if isinstance(dep, str) and "fastmcp" in dep.lower():
-                        return parent
 
-            except Exception as e:
-                console.print(f"[yellow]⚠[/yellow] Could not parse {pyproject_path}: {e}")
-                continue
+@functools.lru_cache(maxsize=32)
+def _is_mcp_pyproject(pyproject_path: str, mtime_ns: int, size: int) -> bool:
+    """
+    Check whether a pyproject.toml declares a fastmcp dependency.
+
+    Cached per file version: the mtime and size arguments are part of the
+    cache key only, so an edited file is re-parsed on the next lookup.
+    """
+    try:
+        with open(pyproject_path, "rb") as f:
+            data = f.read()
+
+        # Cheap reject: a file that never mentions fastmcp can't depend on it
+        if b"fastmcp" not in data.lower():
+            return False
+
+        pyproject = parse_toml(data)
+        _PYPROJECT_CACHE[pyproject_path] = (mtime_ns, size, pyproject)
+
+        # Check if this is an MCP server project
+        dependencies = pyproject.get("project", {}).get("dependencies", []) or []
+
+        # Check for fastmcp dependency: one lower() and one substring scan over
+        # all requirement strings ("fastmcp" has no newline, so it can't match
+        # across two joined entries)
+        joined = "\n".join(dep for dep in dependencies if isinstance(dep, str))
+        return "fastmcp" in joined.lower()
+
+    except Exception as e:
+        _warn(f"Could not parse {pyproject_path}: {e}")
+
+    return False
+
+
+def get_cached_pyproject(project_root: Path) -> dict[str, Any] | None:
+    """
+    Return the parsed pyproject.toml of a project, reusing earlier parses.
+
+    find_project_root() stores every pyproject.toml it parses, so callers
+    that look at the same file right afterwards (e.g. get_project_info) get
+    it without a second read. There is one entry per file, checked against
+    its mtime and size, so an edited file is parsed again and replaces it.
+
+    The returned dict is shared between callers and must not be mutated.
+
+    Args:
+        project_root: Path to the project root directory
+
+    Returns:
+        dict: Parsed pyproject.toml contents
+        None: If the project has no pyproject.toml
+
+    Raises:
+        tomllib.TOMLDecodeError: If pyproject.toml is malformed
+    """
+    pyproject_path = os.path.join(os.fspath(project_root), "pyproject.toml")
+
+    try:
+        st = os.stat(pyproject_path)
+    except FileNotFoundError:
+        return None
+
+    cached = _PYPROJECT_CACHE.get(pyproject_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    with open(pyproject_path, "rb") as f:
+        pyproject = parse_toml(f.read())
+    _PYPROJECT_CACHE[pyproject_path] = (st.st_mtime_ns, st.st_size, pyproject)
+
+    return pyproject
 
-    return None
+
+def parse_toml(data: str | bytes) -> dict[str, Any]:
+    """Parse TOML text or bytes into plain dicts, preferring the stdlib reader."""
+    text = data.decode() if isinstance(data, bytes) else data
+    if tomllib is not None:
+        return tomllib.loads(text)
+    import tomlkit
+
+    return tomlkit.parse(text).unwrap()
 
 
 def find_fips_project_root() -> tuple[Path, dict[str, Any]] | None:
@@ -72,22 +213,23 @@ def find_fips_project_root() -> tuple[Path, dict[str, Any]] | None:
         None: If no .template-info file is found in the current directory or
               any of its parents
     """
-    current_path = Path.cwd()
-
-    for parent in [current_path] + list(current_path.parents):
-        info_file = parent / ".template-info"
-        if not info_file.exists():
-            continue
+    # Same string-based walk as find_project_root()
+    parent = os.getcwd()
+    while True:
+        info_file = os.path.join(parent, ".template-info")
 
-        try:
-            with open(info_file) as f:
-                template_info = json.load(f)
-            return parent, template_info
-        except Exception as e:
-            console.print(f"[yellow]⚠[/yellow] Could not parse {info_file}: {e}")
-            continue
+        if os.path.exists(info_file):
+            try:
+                with open(info_file) as f:
+                    template_info = json.load(f)
+                return Path(parent), template_info
+            except Exception as e:
+                _warn(f"Could not parse {info_file}: {e}")
 
-    return None
+        grandparent = os.path.dirname(parent)
+        if grandparent == parent:
+            return None
+        parent = grandparent
 
 
 def is_valid_component_name(name: str) -> tuple[bool, str]:
@@ -116,30 +258,45 @@ def is_valid_component_name(name: str) -> tuple[bool, str]:
         (False, 'Component name must start with a letter or underscore')
     """
     if not name:
-        return False, "Component name cannot be empty"
+        return False, _COMPONENT_NAME_EMPTY_ERROR
+
+    # Check if it's a Python keyword (keywords are identifiers, so test this first)
+    if name in _KEYWORDS:
+        return False, f"Component name '{name}' is a Python keyword and cannot be used"
 
     # Check if it's a valid Python identifier
     if not name.isidentifier():
         if name[0].isdigit():
-            return False, "Component name must start with a letter or underscore"
-        return False, (
-            "Component name must be a valid Python identifier (use snake_case: "
-            "letters, numbers, underscores only)"
-        )
-
-    # Check if it's a Python keyword
-    if keyword.iskeyword(name):
-        return False, f"Component name '{name}' is a Python keyword and cannot be used"
+            return False, _COMPONENT_NAME_START_ERROR
+        return False, _COMPONENT_NAME_IDENTIFIER_ERROR
 
-    # Recommend snake_case
-    if not re.match(r"^[a-z_][a-z0-9_]*$", name):
-        return False, (
-            "Component name should use snake_case (lowercase letters, numbers, " "underscores only)"
-        )
+    # Recommend snake_case (isidentifier() already ruled out a leading digit)
+    if not _SNAKE_CASE_CHARS.issuperset(name):
+        return False, _COMPONENT_NAME_SNAKE_CASE_ERROR
 
     return True, ""
 
 
+def validate_component_names(names: Iterable[str]) -> list[tuple[bool, str]]:
+    """
+    Validate several component names in one call.
+
+    Each result is the (is_valid, error_message) pair is_valid_component_name()
+    would return for the name at the same position.
+
+    Args:
+        names: Component names to validate
+
+    Returns:
+        list: One (is_valid, error_message) tuple per name, in input order
+
+    Example:
+        >>> validate_component_names(["my_tool", "class"])
+        [(True, ''), (False, "Component name 'class' is a Python keyword and cannot be used")]
+    """
+    return [is_valid_component_name(name) for name in names]
+
+
 def component_exists(project_root: Path, component_type: str, name: str) -> bool:
     """
     Check if a component file already exists.
@@ -161,42 +318,75 @@ def component_exists(project_root: Path, component_type: str, name: str) -> bool
         >>> component_exists(root, "resource", "country-profiles/japan")
         False
     """
-    # Map component types to their directory locations
-    component_dirs = {
-        "tool": "tools",
-        "resource": "resources",
-        "prompt": "prompts",
-        "middleware": "middleware",
-    }
-
-    if component_type not in component_dirs:
+    component_dir = _COMPONENT_DIRS.get(component_type)
+    if component_dir is None:
         return False
 
-    component_dir = component_dirs[component_type]
-
     # Parse name to handle subdirectories
-    name_parts = name.split("/")
-    subdirs = name_parts[:-1]
-    component_name = name_parts[-1]
-
-    # Build path with subdirectories
-    component_base = project_root / "src" / component_dir
-    if subdirs:
-        subdir_path = Path(*subdirs)
-        component_file = component_base / subdir_path / f"{component_name}.py"
-    else:
-        component_file = component_base / f"{component_name}.py"
+    *subdirs, component_name = name.split("/")
+
+    # Build the path as a plain string; only the per-name tail is joined per call
+    component_file = os.path.join(
+        _component_base(project_root, component_dir), *subdirs, component_name + ".py"
+    )
+    return os.path.isfile(component_file)
+
+
+@functools.lru_cache(maxsize=16)
+def _component_base(project_root: Path, component_dir: str) -> str:
+    """Return the src/<component_dir> prefix for a project, built once per pair."""
+    return os.path.join(os.fspath(project_root), "src", component_dir)
+
+
+def scan_all_generators(project_root: Path) -> dict[str, set[str]]:
+    """
+    List every generator template directory of a project in one pass.
 
-    return component_file.exists()
+    Use this when checking several component types at once: pass the result
+    to validate_generator_templates() and each check becomes a dict lookup
+    instead of its own directory read.
 
+    Args:
+        project_root: Path to the project root directory
+
+    Returns:
+        dict: Maps each component type directory under
+              .fips-agents-cli/generators to the set of file names in it.
+              Empty if the generators directory doesn't exist.
 
-def validate_generator_templates(project_root: Path, component_type: str) -> tuple[bool, str]:
+    Example:
+        >>> generators = scan_all_generators(root)
+        >>> for component_type in ("tool", "resource"):
+        ...     validate_generator_templates(root, component_type, generators)
+    """
+    generators_root = project_root / ".fips-agents-cli" / "generators"
+    generators: dict[str, set[str]] = {}
+
+    try:
+        with os.scandir(generators_root) as it:
+            for entry in it:
+                if entry.is_dir():
+                    with os.scandir(entry.path) as files:
+                        generators[entry.name] = {f.name for f in files}
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+
+    return generators
+
+
+def validate_generator_templates(
+    project_root: Path,
+    component_type: str,
+    generators: dict[str, set[str]] | None = None,
+) -> tuple[bool, str]:
     """
     Validate that generator templates exist for the component type.
 
     Args:
         project_root: Path to the project root directory
         component_type: Type of component ('tool', 'resource', 'prompt', 'middleware')
+        generators: Optional result of scan_all_generators() to check against
+                    instead of reading the directory
 
     Returns:
         tuple: (is_valid, error_message)
@@ -211,7 +401,17 @@ def validate_generator_templates(project_root: Path, component_type: str) -> tup
     """
     generators_dir = project_root / ".fips-agents-cli" / "generators" / component_type
 
-    if not generators_dir.exists():
+    if generators is not None:
+        entries = generators.get(component_type)
+    else:
+        # One directory read answers both "does it exist" and "which files are there"
+        try:
+            with os.scandir(generators_dir) as it:
+                entries = {entry.name for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            entries = None
+
+    if entries is None:
         return False, (
             f"Generator templates not found for '{component_type}'\n"
             f"Expected: {generators_dir}\n"
@@ -219,14 +419,9 @@ def validate_generator_templates(project_root: Path, component_type: str) -> tup
         )
 
     # Check for required template files
-    component_template = generators_dir / "component.py.j2"
-    test_template = generators_dir / "test.py.j2"
-
-    missing_files = []
-    if not component_template.exists():
-        missing_files.append("component.py.j2")
-    if not test_template.exists():
-        missing_files.append("test.py.j2")
+    missing_files = [
+        filename for filename in ("component.py.j2", "test.py.j2") if filename not in entries
+    ]
 
     if missing_files:
         return False, (
@@ -269,7 +464,7 @@ def parse_huggingface_repo(url_or_repo: str) -> tuple[str | None, str]:
     if url_or_repo.startswith("http://") or url_or_repo.startswith("https://"):
         # Extract repo ID from URL
         # Expected format: https://huggingface.co/org/model
-        match = re.match(r"https?://(?:www\.)?huggingface\.co/([^/]+/[^/]+)(?:/.*)?$", url_or_repo)
+        match = _HF_URL_RE.match(url_or_repo)
         if match:
             return match.group(1), ""
         else:
@@ -330,83 +525,53 @@ def validate_quay_uri(uri: str) -> tuple[bool, str, dict[str, str]]:
     """
     # Strip protocol if present
     if uri.startswith("https://"):
-        uri = uri[8:]  # Remove "https://"
-    elif uri.startswith("http://"):
-        uri = uri[7:]  # Remove "http://"
+        uri = uri.removeprefix("https://")
+    else:
+        uri = uri.removeprefix("http://")
+
+    # Fast path: a well-formed URI is accepted with a single match
+    match = _CONTAINER_URI_RE.match(uri)
+    if match:
+        return True, "", match.groupdict()
+
+    # Otherwise find the first rule it breaks, for a targeted error message
 
     # Check for tag
     if ":" not in uri:
-        return (
-            False,
-            (
-                "Missing tag in container URI.\n"
-                "Expected format: registry.com/org/repo:tag\n"
-                "Example: quay.io/wjackson/models:granite-3.1-2b-instruct"
-            ),
-            {},
-        )
+        return False, _MISSING_TAG_ERROR, {}
 
     # Split registry and tag
     uri_without_tag, tag = uri.rsplit(":", 1)
 
     if not tag:
-        return (
-            False,
-            (
-                "Empty tag in container URI.\n"
-                "Expected format: registry.com/org/repo:tag\n"
-                "Example: quay.io/wjackson/models:granite-3.1-2b-instruct"
-            ),
-            {},
-        )
+        return False, _EMPTY_TAG_ERROR, {}
 
     # Validate registry format (should contain at least one dot)
     if "/" not in uri_without_tag:
-        return (
-            False,
-            (
-                "Invalid container URI format.\n"
-                "Expected format: registry.com/org/repo:tag\n"
-                "Example: quay.io/wjackson/models:granite-3.1-2b-instruct"
-            ),
-            {},
-        )
+        return False, _INVALID_URI_ERROR, {}
 
     # Split registry and repository
     parts = uri_without_tag.split("/", 1)
     if len(parts) != 2:
-        return (
-            False,
-            (
-                "Invalid container URI format.\n"
-                "Expected format: registry.com/org/repo:tag\n"
-                "Example: quay.io/wjackson/models:granite-3.1-2b-instruct"
-            ),
-            {},
-        )
+        return False, _INVALID_URI_ERROR, {}
 
     registry, repo = parts
 
     # Basic registry validation (should look like a domain)
     if "." not in registry:
-        return (
-            False,
-            (
-                "Invalid registry format (should be a domain like quay.io).\n"
-                "Expected format: registry.com/org/repo:tag\n"
-                "Example: quay.io/wjackson/models:granite-3.1-2b-instruct"
-            ),
-            {},
-        )
+        return False, _INVALID_REGISTRY_ERROR, {}
 
     return True, "", {"registry": registry, "repo": repo, "tag": tag}
 
 
+@functools.lru_cache(maxsize=16)
 def check_registry_login(registry: str) -> tuple[bool, str]:
     """
     Check if user is logged into a container registry.
 
-    Uses `podman login --get-login` to check authentication status.
+    Uses `podman login --get-login` to check authentication status. The
+    result is cached per registry for the life of the process; call
+    clear_registry_login_cache() after logging in or out.
 
     Args:
         registry: Registry domain (e.g., 'quay.io')
@@ -450,3 +615,8 @@ def check_registry_login(registry: str) -> tuple[bool, str]:
         return False, "Podman not installed"
     except Exception as e:
         return False, f"Error checking login: {str(e)}"
+
+
+def clear_registry_login_cache() -> None:
+    """Forget cached check_registry_login() results so the next call re-runs podman."""
+    check_registry_login.cache_clear()
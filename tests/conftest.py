@@ -1,24 +1,30 @@
 """Pytest configuration and fixtures for fips-agents-cli tests."""
 
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
+import os
 
 import pytest
 from click.testing import CliRunner
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Provide a Click CLI test runner."""
+    """Provide a Click CLI test runner.
+
+    CliRunner holds no state between invoke() calls, so one instance serves
+    the whole session.
+    """
     return CliRunner()
 
 
 @pytest.fixture
-def temp_dir():
-    """Provide a temporary directory for test operations."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_dir(tmp_path):
+    """Provide a temporary directory for test operations.
+
+    Backed by pytest's tmp_path, which carves per-test directories out of one
+    session-wide base and prunes old runs itself, instead of a mkdtemp/rmtree
+    pair per test.
+    """
+    return tmp_path
 
 
 @pytest.fixture
@@ -97,11 +103,27 @@ def sample_project_name():
     return "test-mcp-server"
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(autouse=True, scope="session")
 def mock_registry_login():
-    """Mock registry login check for model-car tests."""
-    with patch(
-        "fips_agents_cli.commands.model_car.check_registry_login",
-        return_value=(True, "testuser"),
-    ):
+    """Mock registry login check for model-car tests.
+
+    Applied once per session; a test that needs a different login state
+    overrides it with monkeypatch for its own duration.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "fips_agents_cli.commands.model_car.check_registry_login",
+            lambda registry: (True, "testuser"),
+        )
         yield
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _cwd_guard():
+    """Restore the starting working directory if any test leaks a chdir.
+
+    Tests should still use monkeypatch.chdir; this is only a backstop.
+    """
+    original_cwd = os.getcwd()
+    yield
+    os.chdir(original_cwd)
@@ -1,18 +1,26 @@
 """Integration tests for generate commands."""
 
 import json
+import shutil
 
 import pytest
 from click.testing import CliRunner
 
 from fips_agents_cli.commands.generate import generate
 
+_QUERY_PARAM_JSON = json.dumps(
+    [
+        {
+            "name": "query",
+            "type": "str",
+            "description": "Search query",
+            "required": True,
+        }
+    ]
+).encode()
 
-@pytest.fixture
-def mock_mcp_project(tmp_path):
-    """Create a mock MCP server project structure."""
-    # Create pyproject.toml with fastmcp dependency
-    pyproject_content = """
+
+_PYPROJECT_TOML = """
 [project]
 name = "test-mcp-server"
 version = "0.1.0"
@@ -20,32 +28,15 @@ dependencies = [
     "fastmcp>=0.1.0",
 ]
 """
-    (tmp_path / "pyproject.toml").write_text(pyproject_content)
 
-    # Create source directory structure
-    for component_dir in ["tools", "resources", "prompts", "middleware"]:
-        (tmp_path / "src" / component_dir).mkdir(parents=True)
-
-    # Create test directory structure
-    for component_dir in ["tools", "resources", "prompts", "middleware"]:
-        (tmp_path / "tests" / component_dir).mkdir(parents=True)
-
-    # Create generator templates for each component type
-    for component_type in ["tool", "resource", "prompt", "middleware"]:
-        generators_dir = tmp_path / ".fips-agents-cli" / "generators" / component_type
-        generators_dir.mkdir(parents=True)
-
-        # Create component template
-        component_template = """'''{{ description }}'''
+_COMPONENT_TEMPLATE = """'''{{ description }}'''
 
 {% if async %}async {% endif %}def {{ component_name }}():
     '''{{ description }}'''
     return "TODO: Implement"
 """
-        (generators_dir / "component.py.j2").write_text(component_template)
 
-        # Create test template
-        test_template = """'''Tests for {{ component_name }}.'''
+_TEST_TEMPLATE = """'''Tests for {{ component_name }}.'''
 
 import pytest
 
@@ -57,345 +48,227 @@ async def test_{{ component_name }}_basic():
     result = {% if async %}await {% endif %}{{ component_name }}()
     assert result is not None
 """
-        (generators_dir / "test.py.j2").write_text(test_template)
+
+
+@pytest.fixture(scope="session")
+def _project_skeleton(tmp_path_factory):
+    """Build the mock MCP server project tree once per session."""
+    tmp_path = tmp_path_factory.mktemp("skeleton")
+    # Create pyproject.toml with fastmcp dependency
+    (tmp_path / "pyproject.toml").write_text(_PYPROJECT_TOML)
+
+    # Create the shared parents once so each leaf is a single mkdir
+    src_dir = tmp_path / "src"
+    tests_dir = tmp_path / "tests"
+    generators_root = tmp_path / ".fips-agents-cli" / "generators"
+    src_dir.mkdir()
+    tests_dir.mkdir()
+    generators_root.mkdir(parents=True)
+
+    # Create source and test directory structure
+    for component_dir in ["tools", "resources", "prompts", "middleware"]:
+        (src_dir / component_dir).mkdir()
+        (tests_dir / component_dir).mkdir()
+
+    # Create generator templates for each component type
+    for component_type in ["tool", "resource", "prompt", "middleware"]:
+        generators_dir = generators_root / component_type
+        generators_dir.mkdir()
+        (generators_dir / "component.py.j2").write_text(_COMPONENT_TEMPLATE)
+        (generators_dir / "test.py.j2").write_text(_TEST_TEMPLATE)
 
     return tmp_path
 
 
 @pytest.fixture
+def mock_mcp_project(_project_skeleton, tmp_path):
+    """Create a mock MCP server project structure."""
+    project = tmp_path / "proj"
+    shutil.copytree(_project_skeleton, project)
+    return project
+
+
+@pytest.fixture
+def in_project(mock_mcp_project, monkeypatch):
+    """Run the test from inside the mock MCP project; cwd is restored afterwards."""
+    monkeypatch.chdir(mock_mcp_project)
+    return mock_mcp_project
+
+
+@pytest.fixture(scope="session")
 def runner():
     """Create a Click CLI runner."""
     return CliRunner()
 
 
-class TestGenerateToolCommand:
-    """Tests for generate tool command."""
-
-    def test_generate_tool_basic(self, runner, mock_mcp_project):
-        """Test basic tool generation."""
+@pytest.mark.slow
+class TestGenerateBasic:
+    """Tests for basic generation across component types."""
+
+    @pytest.mark.parametrize(
+        "component_type,name,subdir",
+        [
+            ("tool", "search_data", "tools"),
+            ("resource", "config_data", "resources"),
+            ("prompt", "code_review", "prompts"),
+            ("middleware", "auth_middleware", "middleware"),
+        ],
+    )
+    def test_generate_basic(self, runner, in_project, component_type, name, subdir):
+        """Test basic generation for each component type."""
         result = runner.invoke(
             generate,
-            ["tool", "search_data", "--description", "Search through data"],
-            input="Search through data\n",
+            [component_type, name, "--description", f"Generated {component_type}"],
             catch_exceptions=False,
-            obj={},
-            env={"PWD": str(mock_mcp_project)},
         )
 
-        # Due to cwd changes, we need to run from within the project
-        import os
+        assert result.exit_code == 0
+        assert "success" in result.output.lower() or "created" in result.output.lower()
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
+        # Verify files were created
+        assert (in_project / "src" / subdir / f"{name}.py").exists()
+        assert (in_project / "tests" / subdir / f"test_{name}.py").exists()
 
-            result = runner.invoke(
-                generate,
-                ["tool", "search_data", "--description", "Search through data"],
-                catch_exceptions=False,
-            )
 
-            # Check exit code
-            if result.exit_code != 0:
-                print(f"Output: {result.output}")
-                print(f"Exception: {result.exception}")
-
-            assert result.exit_code == 0
-            assert "success" in result.output.lower() or "created" in result.output.lower()
-
-            # Verify files were created
-            assert (mock_mcp_project / "src" / "tools" / "search_data.py").exists()
-            assert (mock_mcp_project / "tests" / "tools" / "test_search_data.py").exists()
-
-        finally:
-            os.chdir(original_cwd)
+class TestGenerateToolCommand:
+    """Tests for generate tool command."""
 
-    def test_generate_tool_dry_run(self, runner, mock_mcp_project):
+    def test_generate_tool_dry_run(self, runner, in_project):
         """Test dry-run mode shows file paths."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                ["tool", "test_tool", "--description", "Test tool", "--dry-run"],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code == 0
-            assert "dry run" in result.output.lower()
-            # Rich console may wrap long paths, so check for path components
-            output_normalized = result.output.replace("\n", "")
-            assert "src/tools/test_tool.py" in output_normalized
+        result = runner.invoke(
+            generate,
+            ["tool", "test_tool", "--description", "Test tool", "--dry-run"],
+            catch_exceptions=False,
+        )
 
-            # Verify files were NOT created
-            assert not (mock_mcp_project / "src" / "tools" / "test_tool.py").exists()
+        assert result.exit_code == 0
+        assert "dry run" in result.output.lower()
+        # Rich console may wrap long paths, so check for path components
+        output_normalized = result.output.replace("\n", "")
+        assert "src/tools/test_tool.py" in output_normalized
 
-        finally:
-            os.chdir(original_cwd)
+        # Verify files were NOT created
+        assert not (in_project / "src" / "tools" / "test_tool.py").exists()
 
-    def test_generate_tool_with_params(self, runner, mock_mcp_project):
+    @pytest.mark.slow
+    def test_generate_tool_with_params(self, runner, in_project):
         """Test tool generation with params file."""
-        # Create params file
-        params_data = [
-            {
-                "name": "query",
-                "type": "str",
-                "description": "Search query",
-                "required": True,
-            }
-        ]
-        params_file = mock_mcp_project / "params.json"
-        params_file.write_text(json.dumps(params_data))
-
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                [
-                    "tool",
-                    "search_tool",
-                    "--description",
-                    "Search tool",
-                    "--params",
-                    str(params_file),
-                ],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code == 0
-
-        finally:
-            os.chdir(original_cwd)
-
-    def test_generate_tool_invalid_name(self, runner, mock_mcp_project):
-        """Test error with invalid tool name."""
-        import os
+        params_file = in_project / "params.json"
+        params_file.write_bytes(_QUERY_PARAM_JSON)
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
+        result = runner.invoke(
+            generate,
+            [
+                "tool",
+                "search_tool",
+                "--description",
+                "Search tool",
+                "--params",
+                str(params_file),
+            ],
+            catch_exceptions=False,
+        )
 
-            result = runner.invoke(
-                generate,
-                ["tool", "Invalid-Name", "--description", "Test"],
-                catch_exceptions=False,
-            )
+        assert result.exit_code == 0
 
-            assert result.exit_code != 0
-            assert "invalid" in result.output.lower()
+    def test_generate_tool_invalid_name(self, runner, in_project):
+        """Test error with invalid tool name."""
+        result = runner.invoke(
+            generate,
+            ["tool", "Invalid-Name", "--description", "Test"],
+            catch_exceptions=False,
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        assert result.exit_code != 0
+        assert "invalid" in result.output.lower()
 
-    def test_generate_tool_already_exists(self, runner, mock_mcp_project):
+    def test_generate_tool_already_exists(self, runner, in_project):
         """Test error when tool already exists."""
         # Create existing tool
-        tool_file = mock_mcp_project / "src" / "tools" / "existing_tool.py"
+        tool_file = in_project / "src" / "tools" / "existing_tool.py"
         tool_file.write_text("# Existing tool")
 
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                ["tool", "existing_tool", "--description", "Test"],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code != 0
-            assert "exists" in result.output.lower()
+        result = runner.invoke(
+            generate,
+            ["tool", "existing_tool", "--description", "Test"],
+            catch_exceptions=False,
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        assert result.exit_code != 0
+        assert "exists" in result.output.lower()
 
 
 class TestGenerateResourceCommand:
     """Tests for generate resource command."""
 
-    def test_generate_resource_basic(self, runner, mock_mcp_project):
-        """Test basic resource generation."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                ["resource", "config_data", "--description", "Configuration data"],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code == 0
-
-            # Verify files were created
-            assert (mock_mcp_project / "src" / "resources" / "config_data.py").exists()
-            assert (mock_mcp_project / "tests" / "resources" / "test_config_data.py").exists()
-
-        finally:
-            os.chdir(original_cwd)
-
-    def test_generate_resource_with_uri(self, runner, mock_mcp_project):
+    @pytest.mark.slow
+    def test_generate_resource_with_uri(self, runner, in_project):
         """Test resource generation with custom URI."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                [
-                    "resource",
-                    "user_data",
-                    "--description",
-                    "User data",
-                    "--uri",
-                    "resource://users/{id}",
-                ],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code == 0
-
-        finally:
-            os.chdir(original_cwd)
-
-
-class TestGeneratePromptCommand:
-    """Tests for generate prompt command."""
-
-    def test_generate_prompt_basic(self, runner, mock_mcp_project):
-        """Test basic prompt generation."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                ["prompt", "code_review", "--description", "Review code"],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code == 0
-
-            # Verify files were created
-            assert (mock_mcp_project / "src" / "prompts" / "code_review.py").exists()
-            assert (mock_mcp_project / "tests" / "prompts" / "test_code_review.py").exists()
+        result = runner.invoke(
+            generate,
+            [
+                "resource",
+                "user_data",
+                "--description",
+                "User data",
+                "--uri",
+                "resource://users/{id}",
+            ],
+            catch_exceptions=False,
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        assert result.exit_code == 0
 
 
 class TestGenerateMiddlewareCommand:
     """Tests for generate middleware command."""
 
-    def test_generate_middleware_basic(self, runner, mock_mcp_project):
-        """Test basic middleware generation (general wrapper pattern)."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                ["middleware", "auth_middleware", "--description", "Auth middleware"],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code == 0
-
-            # Verify files were created
-            assert (mock_mcp_project / "src" / "middleware" / "auth_middleware.py").exists()
-            assert (mock_mcp_project / "tests" / "middleware" / "test_auth_middleware.py").exists()
-
-        finally:
-            os.chdir(original_cwd)
-
-    def test_generate_middleware_sync(self, runner, mock_mcp_project):
+    @pytest.mark.slow
+    def test_generate_middleware_sync(self, runner, in_project):
         """Test sync middleware generation."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                ["middleware", "sync_middleware", "--description", "Sync middleware", "--sync"],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code == 0
+        result = runner.invoke(
+            generate,
+            ["middleware", "sync_middleware", "--description", "Sync middleware", "--sync"],
+            catch_exceptions=False,
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        assert result.exit_code == 0
 
+    @pytest.mark.slow
     @pytest.mark.parametrize("hook_type", ["before_tool", "after_tool", "on_error"])
-    def test_generate_middleware_hook_types(self, runner, mock_mcp_project, hook_type):
+    def test_generate_middleware_hook_types(self, runner, in_project, hook_type):
         """Test middleware generation with each supported hook type."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                [
-                    "middleware",
-                    f"{hook_type}_middleware",
-                    "--description",
-                    f"{hook_type} middleware",
-                    "--hook-type",
-                    hook_type,
-                ],
-                catch_exceptions=False,
-            )
-
-            assert (
-                result.exit_code == 0
-            ), f"Expected exit 0 for --hook-type {hook_type}, got: {result.output}"
-            assert (mock_mcp_project / "src" / "middleware" / f"{hook_type}_middleware.py").exists()
-
-        finally:
-            os.chdir(original_cwd)
-
-    def test_generate_middleware_invalid_hook_type(self, runner, mock_mcp_project):
-        """Test that an unrecognized hook type is rejected."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
+        result = runner.invoke(
+            generate,
+            [
+                "middleware",
+                f"{hook_type}_middleware",
+                "--description",
+                f"{hook_type} middleware",
+                "--hook-type",
+                hook_type,
+            ],
+            catch_exceptions=False,
+        )
 
-            result = runner.invoke(
-                generate,
-                [
-                    "middleware",
-                    "bad_middleware",
-                    "--hook-type",
-                    "invalid_hook",
-                ],
-            )
+        assert (
+            result.exit_code == 0
+        ), f"Expected exit 0 for --hook-type {hook_type}, got: {result.output}"
+        assert (in_project / "src" / "middleware" / f"{hook_type}_middleware.py").exists()
 
-            assert result.exit_code != 0
+    def test_generate_middleware_invalid_hook_type(self, runner, in_project):
+        """Test that an unrecognized hook type is rejected."""
+        result = runner.invoke(
+            generate,
+            [
+                "middleware",
+                "bad_middleware",
+                "--hook-type",
+                "invalid_hook",
+            ],
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        assert result.exit_code != 0
 
 
 @pytest.fixture
@@ -432,6 +305,7 @@ dependencies = [
     return tmp_path
 
 
+@pytest.mark.slow
 class TestGenerateMiddlewareRealTemplate:
     """Integration tests that render the real v3.x middleware template.
 
@@ -443,124 +317,98 @@ class TestGenerateMiddlewareRealTemplate:
 
     @pytest.mark.parametrize("hook_type", ["before_tool", "after_tool", "on_error"])
     def test_real_template_renders_for_each_hook_type(
-        self, runner, mock_mcp_project_with_real_middleware_template, hook_type
+        self, runner, mock_mcp_project_with_real_middleware_template, monkeypatch, hook_type
     ):
         """Each --hook-type renders valid Python against the real v3.x template."""
         import ast
-        import os
 
         project = mock_mcp_project_with_real_middleware_template
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(project)
-            result = runner.invoke(
-                generate,
-                [
-                    "middleware",
-                    f"{hook_type}_mw",
-                    "--description",
-                    f"{hook_type} hook middleware",
-                    "--hook-type",
-                    hook_type,
-                ],
-                catch_exceptions=False,
-            )
-            assert result.exit_code == 0, result.output
-
-            rendered = project / "src" / "middleware" / f"{hook_type}_mw.py"
-            assert rendered.exists()
-
-            source = rendered.read_text()
-            ast.parse(source)  # raises if invalid Python
-            assert "from fastmcp.server.middleware import" in source
-            assert "class " in source and "Middleware(Middleware):" in source
-            assert "async def on_call_tool" in source
-
-            test_file = project / "tests" / "middleware" / f"test_{hook_type}_mw.py"
-            assert test_file.exists()
-            ast.parse(test_file.read_text())
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(project)
+        result = runner.invoke(
+            generate,
+            [
+                "middleware",
+                f"{hook_type}_mw",
+                "--description",
+                f"{hook_type} hook middleware",
+                "--hook-type",
+                hook_type,
+            ],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0, result.output
+
+        rendered = project / "src" / "middleware" / f"{hook_type}_mw.py"
+        assert rendered.exists()
+
+        source = rendered.read_text()
+        ast.parse(source)  # raises if invalid Python
+        assert "from fastmcp.server.middleware import" in source
+        assert "class " in source and "Middleware(Middleware):" in source
+        assert "async def on_call_tool" in source
+
+        test_file = project / "tests" / "middleware" / f"test_{hook_type}_mw.py"
+        assert test_file.exists()
+        ast.parse(test_file.read_text())
 
     def test_real_template_renders_without_hook_type(
-        self, runner, mock_mcp_project_with_real_middleware_template
+        self, runner, mock_mcp_project_with_real_middleware_template, monkeypatch
     ):
         """Omitting --hook-type still produces a valid generic wrapper (backward compat)."""
         import ast
-        import os
 
         project = mock_mcp_project_with_real_middleware_template
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(project)
-            result = runner.invoke(
-                generate,
-                [
-                    "middleware",
-                    "generic_mw",
-                    "--description",
-                    "generic middleware",
-                ],
-                catch_exceptions=False,
-            )
-            assert result.exit_code == 0, result.output
-
-            rendered = project / "src" / "middleware" / "generic_mw.py"
-            assert rendered.exists()
-            source = rendered.read_text()
-            ast.parse(source)
-            assert "class GenericMwMiddleware(Middleware):" in source
-            assert "async def on_call_tool" in source
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(project)
+        result = runner.invoke(
+            generate,
+            [
+                "middleware",
+                "generic_mw",
+                "--description",
+                "generic middleware",
+            ],
+            catch_exceptions=False,
+        )
+        assert result.exit_code == 0, result.output
+
+        rendered = project / "src" / "middleware" / "generic_mw.py"
+        assert rendered.exists()
+        source = rendered.read_text()
+        ast.parse(source)
+        assert "class GenericMwMiddleware(Middleware):" in source
+        assert "async def on_call_tool" in source
 
 
 class TestGenerateErrorCases:
     """Tests for error handling."""
 
-    def test_not_in_mcp_project(self, runner, tmp_path):
+    def test_not_in_mcp_project(self, runner, tmp_path, monkeypatch):
         """Test error when not in MCP project."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
+        monkeypatch.chdir(tmp_path)
 
-            result = runner.invoke(
-                generate,
-                ["tool", "test_tool", "--description", "Test"],
-                catch_exceptions=False,
-            )
-
-            assert result.exit_code != 0
-            assert "not in an mcp" in result.output.lower()
+        result = runner.invoke(
+            generate,
+            ["tool", "test_tool", "--description", "Test"],
+            catch_exceptions=False,
+        )
 
-        finally:
-            os.chdir(original_cwd)
+        assert result.exit_code != 0
+        assert "not in an mcp" in result.output.lower()
 
-    def test_invalid_params_file(self, runner, mock_mcp_project):
+    def test_invalid_params_file(self, runner, in_project):
         """Test error with invalid params file."""
-        import os
-
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(mock_mcp_project)
-
-            result = runner.invoke(
-                generate,
-                [
-                    "tool",
-                    "test_tool",
-                    "--description",
-                    "Test",
-                    "--params",
-                    "nonexistent.json",
-                ],
-                catch_exceptions=False,
-            )
-
-            # The path validation will fail before our code runs
-            assert result.exit_code != 0
-
-        finally:
-            os.chdir(original_cwd)
+        result = runner.invoke(
+            generate,
+            [
+                "tool",
+                "test_tool",
+                "--description",
+                "Test",
+                "--params",
+                "nonexistent.json",
+            ],
+            catch_exceptions=False,
+        )
+
+        # The path validation will fail before our code runs
+        assert result.exit_code != 0
@@ -7,6 +7,7 @@ from fips_agents_cli.tools.project import (
     customize_agent_project,
     customize_go_project,
     to_module_name,
+    update_project_name,
     validate_project_name,
 )
 
@@ -14,26 +15,19 @@ from fips_agents_cli.tools.project import (
 class TestProjectValidation:
     """Tests for project name validation."""
 
-    def test_validate_valid_names(self):
+    @pytest.mark.parametrize(
+        "name",
+        ["test", "test-server", "test_server", "myproject", "a", "test123", "test-123-server"],
+    )
+    def test_validate_valid_names(self, name):
         """Test that valid project names pass validation."""
-        valid_names = [
-            "test",
-            "test-server",
-            "test_server",
-            "myproject",
-            "a",
-            "test123",
-            "test-123-server",
-        ]
-
-        for name in valid_names:
-            is_valid, error = validate_project_name(name)
-            assert is_valid, f"Expected {name} to be valid, got error: {error}"
-            assert error is None
-
-    def test_validate_invalid_names(self):
-        """Test that invalid project names fail validation."""
-        invalid_names = [
+        is_valid, error = validate_project_name(name)
+        assert is_valid, f"Expected {name} to be valid, got error: {error}"
+        assert error is None
+
+    @pytest.mark.parametrize(
+        "name",
+        [
             "Test",  # Uppercase
             "TEST",  # All uppercase
             "test@server",  # Special char
@@ -42,12 +36,13 @@ class TestProjectValidation:
             "-test",  # Starts with hyphen
             "_test",  # Starts with underscore
             "",  # Empty
-        ]
-
-        for name in invalid_names:
-            is_valid, error = validate_project_name(name)
-            assert not is_valid, f"Expected {name} to be invalid"
-            assert error is not None
+        ],
+    )
+    def test_validate_invalid_names(self, name):
+        """Test that invalid project names fail validation."""
+        is_valid, error = validate_project_name(name)
+        assert not is_valid, f"Expected {name} to be invalid"
+        assert error is not None
 
     def test_validate_empty_name(self):
         """Test that empty project name returns appropriate error."""
@@ -59,26 +54,152 @@ class TestProjectValidation:
 class TestModuleNameConversion:
     """Tests for converting project names to module names."""
 
-    def test_hyphens_to_underscores(self):
-        """Test that hyphens are converted to underscores."""
-        assert to_module_name("test-server") == "test_server"
-        assert to_module_name("my-mcp-server") == "my_mcp_server"
-        assert to_module_name("test-123-server") == "test_123_server"
-
-    def test_underscores_unchanged(self):
-        """Test that existing underscores remain unchanged."""
-        assert to_module_name("test_server") == "test_server"
-        assert to_module_name("my_mcp_server") == "my_mcp_server"
-
-    def test_no_hyphens(self):
-        """Test that names without hyphens are unchanged."""
-        assert to_module_name("testserver") == "testserver"
-        assert to_module_name("myproject") == "myproject"
-
-    def test_mixed_hyphens_underscores(self):
-        """Test names with both hyphens and underscores."""
-        assert to_module_name("test-server_name") == "test_server_name"
-        assert to_module_name("my_test-server") == "my_test_server"
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            # Hyphens become underscores
+            ("test-server", "test_server"),
+            ("my-mcp-server", "my_mcp_server"),
+            ("test-123-server", "test_123_server"),
+            # Existing underscores are unchanged
+            ("test_server", "test_server"),
+            ("my_mcp_server", "my_mcp_server"),
+            # Names without hyphens are unchanged
+            ("testserver", "testserver"),
+            ("myproject", "myproject"),
+            # Mixed hyphens and underscores
+            ("test-server_name", "test_server_name"),
+            ("my_test-server", "my_test_server"),
+        ],
+    )
+    def test_to_module_name(self, name, expected):
+        """Test converting project names to module names."""
+        assert to_module_name(name) == expected
+
+
+class TestUpdateProjectName:
+    """Tests for MCP server project renaming."""
+
+    def _create_mcp_template(self, path, pyproject_text):
+        """Create a minimal single-module MCP template."""
+        path.mkdir(parents=True, exist_ok=True)
+        (path / "pyproject.toml").write_text(pyproject_text)
+        (path / "src" / "mcp_server_template").mkdir(parents=True)
+
+    def test_updates_name_and_scripts(self, temp_dir):
+        """Test that the name, script name, and script module path are updated."""
+        project = temp_dir / "my-server"
+        self._create_mcp_template(
+            project,
+            '[project]\nname = "mcp-server-template"\nversion = "0.1.0"\n\n'
+            "[project.scripts]\n"
+            'mcp-server-template = "mcp_server_template.server:main"\n'
+            'helper = "mcp_server_template.helper:run"\n',
+        )
+
+        update_project_name(project, "my-server")
+
+        pyproject = tomlkit.parse((project / "pyproject.toml").read_text())
+        assert pyproject["project"]["name"] == "my-server"
+        assert dict(pyproject["project"]["scripts"]) == {
+            "my-server": "my_server.server:main",
+            "helper": "my_server.helper:run",
+        }
+        assert (project / "src" / "my_server").is_dir()
+        assert not (project / "src" / "mcp_server_template").exists()
+
+    def test_preserves_comments(self, temp_dir):
+        """Test that comments and unrelated tables are left as written."""
+        project = temp_dir / "my-server"
+        self._create_mcp_template(
+            project,
+            "# Template project\n"
+            '[project]\nname = "mcp-server-template"  # renamed by the CLI\n'
+            'dependencies = ["fastmcp>=2.0"]\n\n'
+            "[tool.ruff]\nline-length = 100\n",
+        )
+
+        update_project_name(project, "my-server")
+
+        content = (project / "pyproject.toml").read_text()
+        assert content == (
+            "# Template project\n"
+            '[project]\nname = "my-server"  # renamed by the CLI\n'
+            'dependencies = ["fastmcp>=2.0"]\n\n'
+            "[tool.ruff]\nline-length = 100\n"
+        )
+
+    def test_inline_scripts_table(self, temp_dir):
+        """Test that layouts the line rewrite can't handle are still renamed."""
+        project = temp_dir / "my-server"
+        self._create_mcp_template(
+            project,
+            '[project]\nname = "mcp-server-template"\n'
+            'scripts = { mcp-server-template = "mcp_server_template.server:main" }\n',
+        )
+
+        update_project_name(project, "my-server")
+
+        pyproject = tomlkit.parse((project / "pyproject.toml").read_text())
+        assert pyproject["project"]["name"] == "my-server"
+        assert dict(pyproject["project"]["scripts"]) == {"my-server": "my_server.server:main"}
+
+    def test_renamed_script_collides_with_existing_key(self, temp_dir):
+        """Test that a rename onto an existing script key falls back to tomlkit."""
+        project = temp_dir / "my-server"
+        self._create_mcp_template(
+            project,
+            '[project]\nname = "tpl"\n\n' '[project.scripts]\ntpl = "tpl:a"\nmy-server = "x:b"\n',
+        )
+
+        update_project_name(project, "my-server")
+
+        pyproject = tomlkit.parse((project / "pyproject.toml").read_text())
+        assert pyproject["project"]["name"] == "my-server"
+        assert dict(pyproject["project"]["scripts"]) == {"my-server": "x:b"}
+
+    def test_array_of_tables_after_project(self, temp_dir):
+        """Test that a name key in a later [[array.of.tables]] is left alone."""
+        project = temp_dir / "my-server"
+        self._create_mcp_template(
+            project,
+            '[project]\nname = "fastmcp-unified-template"\n\n'
+            '[[tool.uv.index]]\nname = "pytorch-cpu"\n'
+            'url = "https://download.pytorch.org/whl/cpu"\n',
+        )
+
+        update_project_name(project, "my-server")
+
+        pyproject = tomlkit.parse((project / "pyproject.toml").read_text())
+        assert pyproject["project"]["name"] == "my-server"
+        assert pyproject["tool"]["uv"]["index"][0]["name"] == "pytorch-cpu"
+
+    def test_array_of_tables_after_scripts(self, temp_dir):
+        """Test that module paths in a later [[array.of.tables]] are left alone."""
+        project = temp_dir / "my-server"
+        self._create_mcp_template(
+            project,
+            '[project]\nname = "fastmcp-unified-template"\n\n'
+            "[project.scripts]\n"
+            'fastmcp-unified-template = "fastmcp_unified_template.server:main"\n\n'
+            "[[tool.mypy.overrides]]\n"
+            'module = "fastmcp_unified_template.*"\n'
+            "ignore_missing_imports = true\n",
+        )
+
+        update_project_name(project, "my-server")
+
+        pyproject = tomlkit.parse((project / "pyproject.toml").read_text())
+        assert dict(pyproject["project"]["scripts"]) == {"my-server": "my_server.server:main"}
+        assert pyproject["tool"]["mypy"]["overrides"][0]["module"] == "fastmcp_unified_template.*"
+
+    def test_missing_pyproject_raises_error(self, temp_dir):
+        """Test that missing pyproject.toml raises FileNotFoundError."""
+        project = temp_dir / "my-server"
+        project.mkdir()
+
+        with pytest.raises(FileNotFoundError):
+            update_project_name(project, "my-server")
 
 
 class TestCustomizeAgentProject:
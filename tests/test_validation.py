@@ -1,280 +1,368 @@
 """Tests for validation utilities."""
 
+import re
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from fips_agents_cli.tools import validation
 from fips_agents_cli.tools.validation import (
+    check_registry_login,
+    clear_registry_login_cache,
     component_exists,
     find_project_root,
+    get_cached_pyproject,
     is_valid_component_name,
+    scan_all_generators,
+    validate_component_names,
     validate_generator_templates,
 )
 
+PYPROJECT_FASTMCP = b"""
+[project]
+name = "test-mcp-server"
+dependencies = [
+    "fastmcp>=0.1.0",
+]
+"""
+
+PYPROJECT_NO_FASTMCP = b"""
+[project]
+name = "test-project"
+dependencies = [
+    "click>=8.0.0",
+]
+"""
+
+EMPTY_ERROR = "Component name cannot be empty"
+START_ERROR = "Component name must start with a letter or underscore"
+IDENTIFIER_ERROR = (
+    "Component name must be a valid Python identifier (use snake_case: "
+    "letters, numbers, underscores only)"
+)
+SNAKE_CASE_ERROR = (
+    "Component name should use snake_case (lowercase letters, numbers, underscores only)"
+)
+
+COMPONENT_TYPES = ("tool", "resource", "prompt", "middleware")
+
+COMPONENT_J2 = "{{ component_name }}"
+TEST_J2 = "test_{{ component_name }}"
+
 
 class TestIsValidComponentName:
     """Tests for component name validation."""
 
-    def test_valid_snake_case_name(self):
-        """Test valid snake_case component name."""
-        is_valid, error = is_valid_component_name("my_tool")
-        assert is_valid is True
-        assert error == ""
+    @pytest.mark.parametrize(
+        "name,valid,expected_error",
+        [
+            ("my_tool", True, ""),
+            ("tool_v2", True, ""),
+            ("_private_tool", True, ""),
+            ("", False, EMPTY_ERROR),
+            ("123tool", False, START_ERROR),
+            ("my-tool", False, IDENTIFIER_ERROR),
+            ("my tool", False, IDENTIFIER_ERROR),
+            ("MyTool", False, SNAKE_CASE_ERROR),
+            ("for", False, "Component name 'for' is a Python keyword and cannot be used"),
+            ("class", False, "Component name 'class' is a Python keyword and cannot be used"),
+            ("my@tool", False, IDENTIFIER_ERROR),
+        ],
+    )
+    def test_is_valid_component_name(self, name, valid, expected_error):
+        """Test validity and the exact error message for each kind of name."""
+        is_valid, error = is_valid_component_name(name)
+        assert is_valid is valid
+        assert error == expected_error
 
-    def test_valid_name_with_numbers(self):
-        """Test valid name with numbers."""
-        is_valid, error = is_valid_component_name("tool_v2")
-        assert is_valid is True
-        assert error == ""
+    def test_keywords_container_is_frozenset(self):
+        """Test that keyword lookups stay an O(1) hash probe."""
+        assert isinstance(validation._KEYWORDS, frozenset)
+        assert "class" in validation._KEYWORDS
 
-    def test_valid_name_starting_with_underscore(self):
-        """Test valid name starting with underscore."""
-        is_valid, error = is_valid_component_name("_private_tool")
-        assert is_valid is True
-        assert error == ""
+    def test_hot_loop_does_not_compile_regexes(self, monkeypatch):
+        """Test that validating names never builds a regex per call."""
 
-    def test_empty_name(self):
-        """Test empty component name is invalid."""
-        is_valid, error = is_valid_component_name("")
-        assert is_valid is False
-        assert "empty" in error.lower()
+        def fail(*args, **kwargs):
+            raise AssertionError("patterns must be compiled at import time")
 
-    def test_name_starting_with_number(self):
-        """Test name starting with number is invalid."""
-        is_valid, error = is_valid_component_name("123tool")
-        assert is_valid is False
-        assert "start with" in error.lower()
+        for name in ("compile", "match", "fullmatch", "search"):
+            monkeypatch.setattr(re, name, fail)
 
-    def test_name_with_hyphens(self):
-        """Test name with hyphens is invalid."""
-        is_valid, error = is_valid_component_name("my-tool")
-        assert is_valid is False
-        assert "identifier" in error.lower()
+        for _ in range(1000):
+            is_valid_component_name("valid_name")
+            is_valid_component_name("Invalid-Name")
 
-    def test_name_with_spaces(self):
-        """Test name with spaces is invalid."""
-        is_valid, error = is_valid_component_name("my tool")
-        assert is_valid is False
-        assert "identifier" in error.lower()
 
-    def test_name_with_uppercase(self):
-        """Test name with uppercase letters is invalid."""
-        is_valid, error = is_valid_component_name("MyTool")
-        assert is_valid is False
-        assert "snake_case" in error.lower()
+class TestValidateComponentNames:
+    """Tests for batch component name validation."""
 
-    def test_python_keyword(self):
-        """Test Python keywords are invalid."""
-        is_valid, error = is_valid_component_name("for")
-        assert is_valid is False
-        assert "keyword" in error.lower()
+    def test_matches_single_name_validation(self):
+        """Test each result matches is_valid_component_name for that name."""
+        names = ["my_tool", "", "123tool", "my-tool", "MyTool", "class"]
 
-    def test_another_python_keyword(self):
-        """Test another Python keyword."""
-        is_valid, error = is_valid_component_name("class")
-        assert is_valid is False
-        assert "keyword" in error.lower()
+        results = validate_component_names(names)
 
-    def test_name_with_special_characters(self):
-        """Test name with special characters is invalid."""
-        is_valid, error = is_valid_component_name("my@tool")
-        assert is_valid is False
-        assert "identifier" in error.lower()
+        assert results == [is_valid_component_name(name) for name in names]
+        assert [is_valid for is_valid, _ in results] == [True, False, False, False, False, False]
 
+    def test_accepts_any_iterable(self):
+        """Test that generators are accepted, not just lists."""
+        assert validate_component_names(name for name in ("a", "b")) == [(True, ""), (True, "")]
 
-class TestFindProjectRoot:
-    """Tests for finding project root."""
 
-    def test_find_root_in_current_directory(self, tmp_path):
-        """Test finding project root in current directory."""
-        # Create a mock MCP project structure
-        pyproject_content = """
-[project]
-name = "test-mcp-server"
-dependencies = [
-    "fastmcp>=0.1.0",
-]
-"""
-        (tmp_path / "pyproject.toml").write_text(pyproject_content)
+@pytest.fixture(scope="module")
+def mcp_project(tmp_path_factory):
+    """Create a read-only MCP project tree shared by the module's lookup tests."""
+    root = tmp_path_factory.mktemp("mcp")
+    (root / "pyproject.toml").write_bytes(PYPROJECT_FASTMCP)
+    (root / "src" / "tools").mkdir(parents=True)
+    return root
 
-        # Change to the directory
-        import os
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            root = find_project_root()
-            assert root == tmp_path
-        finally:
-            os.chdir(original_cwd)
+@pytest.fixture(scope="module")
+def non_mcp_project(tmp_path_factory):
+    """Create a read-only project whose pyproject.toml has no fastmcp dependency."""
+    root = tmp_path_factory.mktemp("nonmcp")
+    (root / "pyproject.toml").write_bytes(PYPROJECT_NO_FASTMCP)
+    return root
 
-    def test_find_root_in_parent_directory(self, tmp_path):
-        """Test finding project root in parent directory."""
-        # Create a mock MCP project structure
-        pyproject_content = """
-[project]
-name = "test-mcp-server"
-dependencies = [
-    "fastmcp>=0.1.0",
-]
-"""
-        (tmp_path / "pyproject.toml").write_text(pyproject_content)
 
-        # Create a subdirectory
-        subdir = tmp_path / "src" / "tools"
-        subdir.mkdir(parents=True)
+@pytest.fixture(scope="module")
+def empty_root(tmp_path_factory):
+    """Provide an empty project root for tests that never write to it."""
+    return tmp_path_factory.mktemp("empty")
 
-        # Change to the subdirectory
-        import os
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(subdir)
-            root = find_project_root()
-            assert root == tmp_path
-        finally:
-            os.chdir(original_cwd)
+@pytest.fixture(scope="module")
+def generators_root(tmp_path_factory):
+    """Create a project with an empty .fips-agents-cli/generators directory, once per module."""
+    root = tmp_path_factory.mktemp("root")
+    (root / ".fips-agents-cli" / "generators").mkdir(parents=True)
+    return root
+
+
+@pytest.fixture(scope="module")
+def generator_tests_parent(tmp_path_factory):
+    """Create one parent directory for the per-test generator template roots."""
+    return tmp_path_factory.mktemp("gentests")
+
+
+class TestFindProjectRoot:
+    """Tests for finding project root."""
+
+    def test_find_root_in_current_directory(self, mcp_project, monkeypatch):
+        """Test finding project root in current directory."""
+        monkeypatch.chdir(mcp_project)
+        root = find_project_root()
+        assert root == mcp_project
+
+    def test_find_root_in_parent_directory(self, mcp_project, monkeypatch):
+        """Test finding project root in parent directory."""
+        monkeypatch.chdir(mcp_project / "src" / "tools")
+        root = find_project_root()
+        assert root == mcp_project
 
-    def test_no_project_root_found(self, tmp_path):
+    def test_no_project_root_found(self, tmp_path, monkeypatch):
         """Test returns None when no project root is found."""
         # Create a directory without pyproject.toml
-        import os
+        monkeypatch.chdir(tmp_path)
+        root = find_project_root()
+        assert root is None
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            root = find_project_root()
-            assert root is None
-        finally:
-            os.chdir(original_cwd)
-
-    def test_project_without_fastmcp_dependency(self, tmp_path):
+    def test_project_without_fastmcp_dependency(self, non_mcp_project, monkeypatch):
         """Test returns None for projects without fastmcp dependency."""
-        # Create a pyproject.toml without fastmcp
-        pyproject_content = """
-[project]
-name = "test-project"
-dependencies = [
-    "click>=8.0.0",
-]
-"""
-        (tmp_path / "pyproject.toml").write_text(pyproject_content)
+        monkeypatch.chdir(non_mcp_project)
+        root = find_project_root()
+        assert root is None
 
-        # Change to the directory
-        import os
+    def test_edited_pyproject_is_reparsed(self, tmp_path, monkeypatch):
+        """Test that a cached result is dropped once pyproject.toml changes."""
+        pyproject_path = tmp_path / "pyproject.toml"
+        pyproject_path.write_text('[project]\nname = "test-project"\ndependencies = []\n')
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            root = find_project_root()
-            assert root is None
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(tmp_path)
+        assert find_project_root() is None
 
+        pyproject_path.write_text(
+            '[project]\nname = "test-project"\ndependencies = ["fastmcp>=0.1.0"]\n'
+        )
+        assert find_project_root() == tmp_path
 
-class TestComponentExists:
-    """Tests for checking if component exists."""
 
-    def test_component_does_not_exist(self, tmp_path):
-        """Test component that doesn't exist."""
-        exists = component_exists(tmp_path, "tool", "my_tool")
-        assert exists is False
+class TestGetCachedPyproject:
+    """Tests for the shared pyproject.toml parse cache."""
 
-    def test_component_exists_tool(self, tmp_path):
-        """Test existing tool component."""
-        # Create a tool file
-        tool_dir = tmp_path / "src" / "tools"
-        tool_dir.mkdir(parents=True)
-        (tool_dir / "my_tool.py").write_text("# Tool code")
+    def test_missing_pyproject(self, tmp_path):
+        """Test returns None when there is no pyproject.toml."""
+        assert get_cached_pyproject(tmp_path) is None
 
-        exists = component_exists(tmp_path, "tool", "my_tool")
-        assert exists is True
+    def test_parse_is_reused_until_file_changes(self, tmp_path):
+        """Test the same parse is returned until pyproject.toml is edited."""
+        pyproject_path = tmp_path / "pyproject.toml"
+        pyproject_path.write_text('[project]\nname = "first"\n')
 
-    def test_component_exists_resource(self, tmp_path):
-        """Test existing resource component."""
-        # Create a resource file
-        resource_dir = tmp_path / "src" / "resources"
-        resource_dir.mkdir(parents=True)
-        (resource_dir / "my_resource.py").write_text("# Resource code")
+        first = get_cached_pyproject(tmp_path)
+        assert first["project"]["name"] == "first"
+        assert get_cached_pyproject(tmp_path) is first
 
-        exists = component_exists(tmp_path, "resource", "my_resource")
-        assert exists is True
+        pyproject_path.write_text('[project]\nname = "second-name"\n')
+        assert get_cached_pyproject(tmp_path)["project"]["name"] == "second-name"
 
-    def test_component_exists_prompt(self, tmp_path):
-        """Test existing prompt component."""
-        # Create a prompt file
-        prompt_dir = tmp_path / "src" / "prompts"
-        prompt_dir.mkdir(parents=True)
-        (prompt_dir / "my_prompt.py").write_text("# Prompt code")
+    def test_edited_file_replaces_entry(self, tmp_path):
+        """Test an edited pyproject.toml replaces its cache entry instead of adding one."""
+        pyproject_path = tmp_path / "pyproject.toml"
+        pyproject_path.write_text('[project]\nname = "first"\n')
+        get_cached_pyproject(tmp_path)
 
-        exists = component_exists(tmp_path, "prompt", "my_prompt")
-        assert exists is True
+        pyproject_path.write_text('[project]\nname = "second-name"\n')
+        second = get_cached_pyproject(tmp_path)
+
+        entries = [k for k in validation._PYPROJECT_CACHE if k.startswith(str(tmp_path))]
+        assert entries == [str(pyproject_path)]
+        assert validation._PYPROJECT_CACHE[str(pyproject_path)][2] is second
 
-    def test_component_exists_middleware(self, tmp_path):
-        """Test existing middleware component."""
-        # Create a middleware file
-        middleware_dir = tmp_path / "src" / "middleware"
-        middleware_dir.mkdir(parents=True)
-        (middleware_dir / "my_middleware.py").write_text("# Middleware code")
 
-        exists = component_exists(tmp_path, "middleware", "my_middleware")
+class TestComponentExists:
+    """Tests for checking if component exists."""
+
+    def test_component_does_not_exist(self, empty_root):
+        """Test component that doesn't exist."""
+        exists = component_exists(empty_root, "tool", "my_tool")
+        assert exists is False
+
+    @pytest.mark.parametrize(
+        "component_type,subdir",
+        [
+            ("tool", "tools"),
+            ("resource", "resources"),
+            ("prompt", "prompts"),
+            ("middleware", "middleware"),
+        ],
+    )
+    def test_component_exists(self, tmp_path, component_type, subdir):
+        """Test an existing component of each type is found."""
+        component_dir = tmp_path / "src" / subdir
+        component_dir.mkdir(parents=True)
+        (component_dir / f"my_{component_type}.py").touch()
+
+        exists = component_exists(tmp_path, component_type, f"my_{component_type}")
         assert exists is True
 
-    def test_invalid_component_type(self, tmp_path):
+    def test_invalid_component_type(self, empty_root):
         """Test invalid component type returns False."""
-        exists = component_exists(tmp_path, "invalid_type", "my_component")
+        exists = component_exists(empty_root, "invalid_type", "my_component")
         assert exists is False
 
 
 class TestValidateGeneratorTemplates:
     """Tests for validating generator templates."""
 
-    def test_templates_exist(self, tmp_path):
+    @pytest.fixture
+    def root(self, generator_tests_parent, request):
+        """Provide a fresh project root per test under the shared parent."""
+        root = generator_tests_parent / re.sub(r"[^\w.-]", "_", request.node.name)
+        root.mkdir()
+        return root
+
+    def test_templates_exist(self, root):
         """Test valid generator templates."""
         # Create generator template structure
-        generators_dir = tmp_path / ".fips-agents-cli" / "generators" / "tool"
+        generators_dir = root / ".fips-agents-cli" / "generators" / "tool"
         generators_dir.mkdir(parents=True)
-        (generators_dir / "component.py.j2").write_text("{{ component_name }}")
-        (generators_dir / "test.py.j2").write_text("test_{{ component_name }}")
+        (generators_dir / "component.py.j2").write_text(COMPONENT_J2)
+        (generators_dir / "test.py.j2").write_text(TEST_J2)
 
-        is_valid, error = validate_generator_templates(tmp_path, "tool")
+        is_valid, error = validate_generator_templates(root, "tool")
         assert is_valid is True
         assert error == ""
 
-    def test_generators_directory_missing(self, tmp_path):
+    def test_generators_directory_missing(self, root):
         """Test missing generators directory."""
-        is_valid, error = validate_generator_templates(tmp_path, "tool")
+        is_valid, error = validate_generator_templates(root, "tool")
         assert is_valid is False
         assert "not found" in error.lower()
 
-    def test_component_template_missing(self, tmp_path):
-        """Test missing component template."""
-        # Create generator directory but missing component.py.j2
-        generators_dir = tmp_path / ".fips-agents-cli" / "generators" / "tool"
+    @pytest.mark.parametrize(
+        "present,content,expected_missing",
+        [
+            ("test.py.j2", TEST_J2, "component.py.j2"),
+            ("component.py.j2", COMPONENT_J2, "test.py.j2"),
+        ],
+    )
+    def test_template_missing(self, root, present, content, expected_missing):
+        """Test that a generator directory missing either template is rejected."""
+        generators_dir = root / ".fips-agents-cli" / "generators" / "tool"
         generators_dir.mkdir(parents=True)
-        (generators_dir / "test.py.j2").write_text("test_{{ component_name }}")
+        (generators_dir / present).write_text(content)
 
-        is_valid, error = validate_generator_templates(tmp_path, "tool")
+        is_valid, error = validate_generator_templates(root, "tool")
         assert is_valid is False
-        assert "component.py.j2" in error
+        assert expected_missing in error
 
-    def test_test_template_missing(self, tmp_path):
-        """Test missing test template."""
-        # Create generator directory but missing test.py.j2
-        generators_dir = tmp_path / ".fips-agents-cli" / "generators" / "tool"
-        generators_dir.mkdir(parents=True)
-        (generators_dir / "component.py.j2").write_text("{{ component_name }}")
-
-        is_valid, error = validate_generator_templates(tmp_path, "tool")
+    @pytest.mark.parametrize("component_type", COMPONENT_TYPES)
+    def test_all_component_types(self, generators_root, component_type):
+        """Test validation for all component types."""
+        # Each case adds only its own type directory under the shared root
+        generators_dir = generators_root / ".fips-agents-cli" / "generators" / component_type
+        generators_dir.mkdir()
+        (generators_dir / "component.py.j2").write_text(COMPONENT_J2)
+        (generators_dir / "test.py.j2").write_text(TEST_J2)
+
+        is_valid, error = validate_generator_templates(generators_root, component_type)
+        assert is_valid is True, error
+
+    def test_with_prescanned_generators(self, root):
+        """Test validation against a scan_all_generators() result."""
+        generators_dir = root / ".fips-agents-cli" / "generators"
+        (generators_dir / "tool").mkdir(parents=True)
+        (generators_dir / "tool" / "component.py.j2").write_text(COMPONENT_J2)
+        (generators_dir / "tool" / "test.py.j2").write_text(TEST_J2)
+        (generators_dir / "prompt").mkdir()
+        (generators_dir / "prompt" / "component.py.j2").write_text(COMPONENT_J2)
+
+        generators = scan_all_generators(root)
+        assert generators == {
+            "tool": {"component.py.j2", "test.py.j2"},
+            "prompt": {"component.py.j2"},
+        }
+
+        assert validate_generator_templates(root, "tool", generators) == (True, "")
+
+        is_valid, error = validate_generator_templates(root, "prompt", generators)
         assert is_valid is False
         assert "test.py.j2" in error
 
-    def test_all_component_types(self, tmp_path):
-        """Test validation for all component types."""
-        component_types = ["tool", "resource", "prompt", "middleware"]
+        is_valid, error = validate_generator_templates(root, "resource", generators)
+        assert is_valid is False
+        assert "not found" in error.lower()
 
-        for component_type in component_types:
-            # Create generator template structure
-            generators_dir = tmp_path / ".fips-agents-cli" / "generators" / component_type
-            generators_dir.mkdir(parents=True, exist_ok=True)
-            (generators_dir / "component.py.j2").write_text("{{ component_name }}")
-            (generators_dir / "test.py.j2").write_text("test_{{ component_name }}")
+    def test_scan_without_generators_directory(self, root):
+        """Test scanning a project with no generators directory."""
+        assert scan_all_generators(root) == {}
 
-            is_valid, error = validate_generator_templates(tmp_path, component_type)
-            assert is_valid is True, f"Failed for {component_type}: {error}"
+
+class TestCheckRegistryLogin:
+    """Tests for the cached registry login check."""
+
+    def test_result_cached_per_registry(self):
+        """Test that podman runs once per registry until the cache is cleared."""
+        completed = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="testuser\n", stderr=""
+        )
+        clear_registry_login_cache()
+        try:
+            with patch("subprocess.run", return_value=completed) as mock_run:
+                assert check_registry_login("quay.io") == (True, "testuser")
+                assert check_registry_login("quay.io") == (True, "testuser")
+                assert mock_run.call_count == 1
+
+                check_registry_login("registry.example.com")
+                assert mock_run.call_count == 2
+
+                clear_registry_login_cache()
+                check_registry_login("quay.io")
+                assert mock_run.call_count == 3
+        finally:
+            clear_registry_login_cache()